@@ -23,6 +23,11 @@ import threading
 from typing import Callable, NamedTuple, Any, List, Union, Optional
 from enum import IntEnum
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    import json as _json
+
 
 class ABBException(Exception):
     """
@@ -300,7 +305,7 @@ class RWS:
         response_json = None
         if response.headers["Content-Type"] == "application/json" and len(response.content) > 0:
             try:
-                response_json = response.json()
+                response_json = _json.loads(response.content)
             except:
                 if not response.text.startswith("<?xml"):
                     raise
@@ -1032,7 +1037,7 @@ class RWS:
         :param value: The new variable float array value
         :param task: The task containing the pers variable
         """
-        self.set_rapid_variable(var, "[" + ",".join([str(s) for s in val]) + "]", task)
+        self.set_rapid_variable(var, "[" + ",".join(map(str, val)) + "]", task)
 
     def read_ipc_message(self, queue_name: str, timeout: float = 0) -> List[IpcMessage]:
         """
@@ -1381,7 +1386,7 @@ class RWSSubscription:
     Subscription returned from :meth:`RWS.subscribe()`
     """
 
-    def __init__(self, ws_url, header, handler):
+    def __init__(self, ws_url, header, handler, subprotocol="robapi2_subscription"):
         self.handler = handler
 
         self._signal_re = re.compile(
@@ -1409,7 +1414,7 @@ class RWSSubscription:
             on_message=self._on_message,
             on_error=self._on_error,
             on_close=self._on_close,
-            subprotocols=["robapi2_subscription"],
+            subprotocols=[subprotocol],
         )
 
         self.thread = threading.Thread(target=self._run)
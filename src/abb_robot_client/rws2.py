@@ -1,23 +1,96 @@
 import time
 import re
-from typing import List, Optional, Any, Union
-from pydantic import BaseModel
-from requests.auth import HTTPBasicAuth
+import io
+import functools
+import typing
+import threading
+import operator
+import urllib.parse
+from contextlib import contextmanager
+from typing import Annotated, Callable, Dict, Iterator, List, NamedTuple, Optional, Any, Sequence, Tuple, Union
+from pydantic import BaseModel, BeforeValidator, Field
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth, _basic_auth_str
 import requests
 import urllib3
+from urllib3.util.retry import Retry
 import datetime
 from enum import IntEnum
 from loguru import logger
 import numpy as np
-from abb_robot_client.rws import ABBException, JointTarget, RobTarget, WObjData, ToolData
+from abb_robot_client.rws import (
+    ABBException,
+    JointTarget,
+    RobTarget,
+    WObjData,
+    ToolData,
+    RWSSubscription,
+    SubscriptionClosed,
+    SubscriptionException,
+)
+from abb_robot_client.rws import Signal as _SignalEvent
+from abb_robot_client.rws import _json
+
+try:
+    import pycurl
+except ImportError:  # pycurl is optional, only needed for transport="pycurl"
+    pycurl = None
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+_ROBAX_KEYS = operator.itemgetter("rax_1", "rax_2", "rax_3", "rax_4", "rax_5", "rax_6")
+_EXTAX_KEYS = operator.itemgetter("eax_a", "eax_b", "eax_c", "eax_d", "eax_e", "eax_f")
+_TRANS_KEYS = operator.itemgetter("x", "y", "z")
+_ROT_KEYS = operator.itemgetter("q1", "q2", "q3", "q4")
+_ROBCONF_KEYS = operator.itemgetter("cf1", "cf4", "cf6", "cfx")
 
-class RAPIDExecutionState(BaseModel):
+# Slices of the fixed-width event log timestamp "YYYY-MM-DD T HH:MM:SS"
+_TSTAMP_SLICES = (slice(0, 4), slice(5, 7), slice(8, 10), slice(13, 15), slice(16, 18), slice(19, 21))
+
+
+def _parse_elog_tstamp(tstamp: str) -> datetime.datetime:
+    return datetime.datetime(*[int(tstamp[s]) for s in _TSTAMP_SLICES])
+
+
+def _encode_form(data) -> Union[bytes, str]:
+    """Encode a small form payload to bytes once, so requests sends it without re-encoding"""
+    if data is None:
+        return ""
+    if isinstance(data, dict):
+        return urllib.parse.urlencode(data).encode("ascii")
+    return data
+
+
+def _field_converter(hint: Any) -> Callable[[Any], Any]:
+    if hint in (int, float, str):
+        return hint
+    args = typing.get_args(hint)
+    if typing.get_origin(hint) is Union and len(args) == 2 and type(None) in args:
+        inner = _field_converter(args[0] if args[1] is type(None) else args[1])
+        return lambda v: None if v is None else inner(v)
+    return lambda v: v
+
+
+@functools.lru_cache(maxsize=None)
+def _tuple_converters(cls) -> Dict[str, Callable[[Any], Any]]:
+    return {name: _field_converter(hint) for name, hint in typing.get_type_hints(cls).items()}
+
+
+def _validate_tuple(cls, obj: Dict[str, Any]):
+    # Stand-in for pydantic's model_validate on the NamedTuple value types: ignore keys that are not fields
+    # (the controller sends extra ones) and coerce values to the annotated field types
+    converters = _tuple_converters(cls)
+    return cls(**{k: converters[k](v) for k, v in obj.items() if k in converters})
+
+
+class RAPIDExecutionState(NamedTuple):
     ctrlexecstate: Any
     cycle: Any
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
+
 
 class EventLogEntry(BaseModel):
     seqnum: int
@@ -32,20 +105,64 @@ class EventLogEntry(BaseModel):
     actions: str
 
 
+class _EventLogArg(BaseModel):
+    value: Any = None
+
+
+class _EventLogResource(BaseModel):
+    title_path: str = Field(alias="_title")
+    msgtype: int
+    code: int
+    tstamp: Annotated[datetime.datetime, BeforeValidator(_parse_elog_tstamp)]
+    title: str
+    desc: str
+    conseqs: str
+    causes: str
+    actions: str
+    argv: List[_EventLogArg] = []
+
+
+class _EventLogResources(BaseModel):
+    resources: List[_EventLogResource]
+
+
+class _EventLogResponse(BaseModel):
+    embedded: _EventLogResources = Field(alias="_embedded")
+
+
 class EventLogEntryEvent(BaseModel):
     seqnum: int
 
 
+def _parse_task_flag(v: Any) -> Any:
+    # The controller reports task flags as strings such as "On"/"Off"; anything unrecognised is False
+    if isinstance(v, str):
+        return v.strip().lower() in {"on", "true", "1"}
+    return v
+
+
+_TaskFlag = Annotated[bool, BeforeValidator(_parse_task_flag)]
+
+
 class TaskState(BaseModel):
     name: str
     type: str
     taskstate: str
     excstate: str
-    active: bool
-    motiontask: bool
+    active: _TaskFlag
+    motiontask: _TaskFlag
+
 
+class _TaskResources(BaseModel):
+    # Non-task resources (and tasks that fail validation) fall through to a plain dict
+    resources: List[Annotated[Union[TaskState, Dict[str, Any]], Field(union_mode="left_to_right")]]
 
-class RobAx(BaseModel):
+
+class _TaskListResponse(BaseModel):
+    embedded: _TaskResources = Field(alias="_embedded")
+
+
+class RobAx(NamedTuple):
     rax_1: float
     rax_2: float
     rax_3: float
@@ -53,8 +170,12 @@ class RobAx(BaseModel):
     rax_5: float
     rax_6: float
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
+
 
-class ExtAx(BaseModel):
+class ExtAx(NamedTuple):
     eax_a: float
     eax_b: float
     eax_c: float
@@ -62,6 +183,10 @@ class ExtAx(BaseModel):
     eax_e: float
     eax_f: float
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
+
 
 class IpcMessage(BaseModel):
     data: str
@@ -71,24 +196,40 @@ class IpcMessage(BaseModel):
     queue_name: str
 
 
-class Signal(BaseModel):
+class Signal(NamedTuple):
     name: str
     lvalue: str
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
+
 
-class ControllerState(BaseModel):
+class ControllerState(NamedTuple):
     state: str
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
 
-class OperationalMode(BaseModel):
+
+class OperationalMode(NamedTuple):
     mode: str
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
+
 
-class VariableValue(BaseModel):
+class VariableValue(NamedTuple):
     name: str
     value: str
     task: Optional[str] = None
 
+    @classmethod
+    def model_validate(cls, obj: Dict[str, Any]):
+        return _validate_tuple(cls, obj)
+
 
 class SubscriptionResourceType(IntEnum):
     """Enum to select resource to subscribe. See :meth:`.RWS.subscribe()`"""
@@ -134,23 +275,133 @@ class RWS2:
                      of the robot controller. The WAN port ethernet must be used, not the maintenance port.
     :param username: The HTTPS username for the robot. Defaults to 'Default User'
     :param password: The HTTPS password for the robot. Defaults to 'robotics'
+    :param timeout: The `(connect, read)` timeout in seconds applied to every HTTP request. Defaults to (1.0, 5.0)
+    :param transport: HTTP transport for the mastership request/release calls. `requests` (default) or
+                      `pycurl`, which sends them through a single persistent libcurl handle sharing the session
+                      cookies. The `pycurl` package must be installed to use it.
     """
 
     def __init__(
-        self, base_url: str = "https://127.0.0.1:80", username: str = "Default User", password: str = "robotics"
+        self,
+        base_url: str = "https://127.0.0.1:80",
+        username: str = "Default User",
+        password: str = "robotics",
+        timeout: Union[float, Tuple[float, float]] = (1.0, 5.0),
+        transport: str = "requests",
     ):
         self.base_url = base_url
+        self._timeout = timeout
         self.username = username
         self.password = password
         self.auth = HTTPBasicAuth(username, password)
         self._session = requests.Session()
-        self._rmmp_session = None
-        self._rmmp_session_t = None
+        # Size the connection pool for burst polling and keep connections alive between calls
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.05, status_forcelist=(502, 503, 504)),
+            pool_block=False,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._rmmp_session_t = time.monotonic()
+        self._mastership_held = False
+        self._tasks_cache: Optional[Tuple[float, Dict[str, TaskState]]] = None
+        self._tasks_cache_ttl = 0.5
+        self._pers_cache: Dict[Tuple[Optional[str], str], Tuple[float, str]] = {}
+        self._pers_ttl = 0.02
+        # Write generations per variable (and for invalidate_rapid_cache) so a read that overlapped a write
+        # does not store its possibly stale value in the cache
+        self._pers_gen: Dict[Tuple[Optional[str], str], int] = {}
+        self._pers_epoch = 0
+        self._signal_values: Dict[str, int] = {}
+        # Fixed endpoints used outside the _do_* helpers, built once since base_url does not change
+        self._urls = {
+            "root": f"{self.base_url}/",
+            "mastership_request": f"{self.base_url}/rw/mastership/request",
+            "mastership_release": f"{self.base_url}/rw/mastership/release",
+            "subscription": f"{self.base_url}/subscription",
+        }
         self.header = {
             "accept": "application/hal+json;v=2.0",
             "Content-Type": "application/x-www-form-urlencoded;v=2.0",
+            "Connection": "keep-alive",
         }
+        # requests merges session headers into every call, so set them once instead of per request
+        self._session.headers.update(self.header)
+        self._session.auth = self.auth
+        self._upload_header = {"Content-Type": "text/plain;v=2.0"}
         self._session.verify = False
+        # Skip per-request proxy/CA/netrc environment lookups; the controller is reached directly
+        self._session.trust_env = False
+        self._curl = None
+        if transport == "pycurl":
+            if pycurl is None:
+                raise ImportError("transport='pycurl' requires the pycurl package")
+            self._curl = self._make_curl()
+            self._curl_lock = threading.Lock()
+        elif transport != "requests":
+            raise ValueError(f"Invalid transport: {transport}")
+
+    def _split_timeout(self) -> Tuple[float, float]:
+        if isinstance(self._timeout, tuple):
+            return self._timeout
+        return self._timeout, self._timeout
+
+    def _make_curl(self):
+        c = pycurl.Curl()
+        c.setopt(pycurl.TCP_KEEPALIVE, 1)
+        c.setopt(pycurl.FORBID_REUSE, 0)
+        c.setopt(pycurl.HTTPAUTH, pycurl.HTTPAUTH_BASIC)
+        c.setopt(pycurl.USERPWD, f"{self.username}:{self.password}")
+        c.setopt(pycurl.SSL_VERIFYPEER, 0)
+        c.setopt(pycurl.SSL_VERIFYHOST, 0)
+        c.setopt(pycurl.HTTPHEADER, [f"{k}: {v}" for k, v in self.header.items()])
+        connect, read = self._split_timeout()
+        c.setopt(pycurl.CONNECTTIMEOUT_MS, int(connect * 1000))
+        c.setopt(pycurl.TIMEOUT_MS, int((connect + read) * 1000))
+        return c
+
+    def _curl_post(self, url: str, data: bytes = b"") -> Tuple[int, bytes]:
+        # Mastership belongs to the controller session, so the curl handle must present the same session
+        # cookies as the requests session and hand back any cookie the controller sets.
+        body = io.BytesIO()
+        headers: List[bytes] = []
+        with self._curl_lock:
+            c = self._curl
+            c.setopt(pycurl.URL, url)
+            c.setopt(pycurl.POSTFIELDS, data)
+            c.setopt(pycurl.COOKIE, "; ".join(f"{k.name}={k.value}" for k in self._session.cookies))
+            c.setopt(pycurl.HEADERFUNCTION, headers.append)
+            c.setopt(pycurl.WRITEDATA, body)
+            try:
+                c.perform()
+            except pycurl.error as e:
+                # Surface transport failures the same way the requests transport does
+                raise requests.ConnectionError(f"POST {url} failed: {e}") from e
+            status = c.getinfo(pycurl.RESPONSE_CODE)
+        jar = self._session.cookies
+        for line in headers:
+            if line[:11].lower() == b"set-cookie:":
+                name, _, value = line[11:].split(b";", 1)[0].strip().decode("latin-1").partition("=")
+                # Replace the existing cookie in its own domain/path instead of adding a second one beside it
+                existing = [ck for ck in jar if ck.name == name]
+                if existing:
+                    domain, path = existing[0].domain, existing[0].path
+                    for ck in existing:
+                        jar.clear(ck.domain, ck.path, ck.name)
+                else:
+                    domain, path = urllib.parse.urlsplit(self.base_url).hostname, "/"
+                jar.set(name, value, domain=domain, path=path)
+        return status, body.getvalue()
+
+    def _post_status(self, url: str, data: bytes = b"") -> int:
+        if self._curl is not None:
+            return self._curl_post(url, data)[0]
+        # stream=True leaves the (normally empty) body unread; close() discards it
+        response = self._session.post(url, data=data, timeout=self._timeout, stream=True)
+        response.close()
+        return response.status_code
 
     def _wait_for_mastership(self, timeout: float = 5.0, poll_interval: float = 0.05) -> bool:
         """Poll controller mastership state until acquired or timeout."""
@@ -165,41 +416,65 @@ class RWS2:
             time.sleep(poll_interval)
         return False
 
-    def _do_get(self, relative_url: str, params=None):
-        url = f"{self.base_url}/{relative_url}"
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _build_url(base_url: str, relative_url: str) -> str:
+        return f"{base_url}/{relative_url}"
+
+    def _url(self, relative_url: str) -> str:
+        return self._build_url(self.base_url, relative_url)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _io_url(signal: str, network: str = "", unit: str = "", suffix: str = "") -> str:
+        if network:
+            return f"rw/iosystem/signals/{network}/{unit or 'DRV_1'}/{signal}{suffix}"
+        return f"rw/iosystem/signals/{signal}{suffix}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _rapid_symbol_url(var: str, task: Optional[str] = "T_ROB1") -> str:
+        var1 = f"{task}/{var}" if task is not None else var
+        return f"rw/rapid/symbol/RAPID/{var1}/data?mastership=implicit"
+
+    def _do_get(self, relative_url: str, params=None, timeout=None):
+        url = self._url(relative_url)
         try:
-            response = self._session.get(
-                url, headers=self.header, auth=self.auth, params=params, verify=self._session.verify
-            )
+            response = self._session.get(url, params=params, timeout=timeout or self._timeout)
+            response.raise_for_status()
+            return _json.loads(response.content) if response.content else None
+        except (requests.RequestException, ValueError) as e:
+            logger.opt(exception=True).error("HTTP GET {} failed: {}", url, e)
+            return None
+
+    def _do_get_bytes(self, relative_url: str, params=None) -> Optional[bytes]:
+        url = self._url(relative_url)
+        try:
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
-            return response.json()
+            return response.content
         except requests.RequestException as e:
-            print(f"Error occurred: {e}")
+            logger.opt(exception=True).error("HTTP GET {} failed: {}", url, e)
             return None
 
     def _do_get_raw(self, relative_url: str, params=None):
-        url = f"{self.base_url}/{relative_url}"
-        response = self._session.get(
-            url, headers=self.header, auth=self.auth, params=params, verify=self._session.verify
-        )
+        url = self._url(relative_url)
+        response = self._session.get(url, params=params, timeout=self._timeout)
         return response
 
     def _do_post(self, relative_url: str, data=None):
-        headers = self.header.copy()
-        headers["Content-Type"] = "application/x-www-form-urlencoded;v=2.0"
         needs_mastership = "mastership=implicit" in relative_url
         post_relative_url = relative_url
-        post_url = f"{self.base_url}/{post_relative_url}"
+        post_url = self._url(post_relative_url)
         response = None
+        body = _encode_form(data)
         max_attempts = 3 if needs_mastership else 1
         try:
             for attempt in range(1, max_attempts + 1):
                 response = self._session.post(
                     post_url,
-                    headers=headers,
-                    auth=self.auth,
-                    data=data if data is not None else "",
-                    verify=self._session.verify,
+                    data=body,
+                    timeout=self._timeout,
                 )
                 if response.status_code == 403 and needs_mastership and attempt < max_attempts:
                     explicit_ok = self.request_mastership()
@@ -214,46 +489,57 @@ class RWS2:
                     logger.warning(
                         f"Mastership attempt {attempt}/{max_attempts} rejected with 403 for '{post_relative_url}', retrying"
                     )
-                    self.release_mastership()
+                    if not self._mastership_held:
+                        self.release_mastership()
                     time.sleep(0.1 * attempt)
                     continue
 
                 response.raise_for_status()
-                return response.json() if response.content else None
+                return _json.loads(response.content) if response.content else None
 
             # If we exhausted retries and still didn't return, raise a consistent error.
             raise ABBException("Mastership required for this operation", 403)
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             if response is not None and response.status_code == 403:
                 response_excerpt = response.text[:500] if response.text else "<no-body>"
                 logger.error(
                     f"Mastership required for this operation ({post_relative_url}) status=403 body={response_excerpt}"
                 )
                 raise ABBException("Mastership required for this operation", 403)
-            print(f"Error occurred: {e}")
+            logger.opt(exception=True).error("HTTP POST {} failed: {}", post_url, e)
             return None
         finally:
-            if needs_mastership:
+            if needs_mastership and not self._mastership_held:
                 self.release_mastership()
 
     def _do_post_raw(self, relative_url: str, data=None):
-        url = f"{self.base_url}/{relative_url}"
-        headers = self.header.copy()
-        response = self._session.post(
-            url, headers=headers, auth=self.auth, data=data if data is not None else "", verify=self._session.verify
+        url = self._url(relative_url)
+        response = self._session.post(url, data=_encode_form(data), timeout=self._timeout)
+
+        return response
+
+    def _do_put(self, relative_url: str, data, headers: Optional[Dict[str, str]] = None):
+        url = self._url(relative_url)
+        response = self._session.put(
+            url,
+            data,
+            headers=headers if headers is not None else self._upload_header,
+            timeout=self._timeout,
         )
+        return response
 
+    def _do_delete(self, relative_url: str):
+        url = self._url(relative_url)
+        response = self._session.delete(url, timeout=self._timeout)
         return response
 
     def ping(self, timeout: float = 1.0) -> bool:
         """Return True if the controller root endpoint responds with HTTP 200."""
         try:
             res = self._session.get(
-                f"{self.base_url}/",
-                auth=self.auth,
+                self._urls["root"],
                 headers={"accept": "application/hal+json;v=2.0"},
                 timeout=timeout,
-                verify=self._session.verify,
             )
             try:
                 return res.status_code == 200
@@ -275,15 +561,22 @@ class RWS2:
             if t not in rob_tasks:
                 raise Exception(f"Cannot start unknown task {t}")
 
+        changes = []
         for rob_task in rob_tasks.values():
             if not rob_task.motiontask:
                 continue
             if rob_task.name in tasks:
                 if not rob_task.active:
-                    self.activate_task(rob_task.name)
+                    changes.append((self.activate_task, rob_task.name))
             else:
                 if rob_task.active:
-                    self.deactivate_task(rob_task.name)
+                    changes.append((self.deactivate_task, rob_task.name))
+
+        if changes:
+            # Hold mastership once across all task (de)activations instead of once per call
+            with self.mastership():
+                for change, task in changes:
+                    change(task)
 
         payload = {
             "regain": "continue",
@@ -294,6 +587,7 @@ class RWS2:
             "alltaskbytsp": "true",
         }
         _res = self._do_post("rw/rapid/execution/start?mastership=implicit", payload)
+        self._tasks_cache = None
 
     def activate_task(self, task: str):
         """
@@ -302,6 +596,7 @@ class RWS2:
         :param task: The name of the task to activate
         """
         self._do_post("rw/rapid/tasks/activate?mastership=implicit", data={"task": task})
+        self._tasks_cache = None
 
     def deactivate_task(self, task: str) -> None:
         """
@@ -310,6 +605,7 @@ class RWS2:
         :param task: The name of the task to deactivate
         """
         self._do_post(f"rw/rapid/tasks/{task}/deactivate?mastership=implicit", data={"task": task})
+        self._tasks_cache = None
 
     def stop(self):
         """
@@ -317,6 +613,7 @@ class RWS2:
         """
         payload = {"stopmode": "stop"}
         _res = self._do_post("rw/rapid/execution/stop?mastership=implicit", payload)
+        self._tasks_cache = None
 
     def resetpp(self):
         """
@@ -350,7 +647,7 @@ class RWS2:
         """
         res_json = self._do_get("rw/rapid/execution")
         state = res_json["state"][0]
-        return RAPIDExecutionState.model_validate({"ctrlexecstate": state["ctrlexecstate"], "cycle": state["cycle"]})
+        return RAPIDExecutionState(ctrlexecstate=state["ctrlexecstate"], cycle=state["cycle"])
 
     def get_controller_state(self) -> str:
         """
@@ -406,11 +703,7 @@ class RWS2:
         :param unit: The device unit of the signal. If the device is <none> leave default value ''.
         :return: The value of the signal. Typically 1 for ON and 0 for OFF
         """
-        if network:
-            path = f"rw/iosystem/signals/{network}/{unit or 'DRV_1'}/{signal}"
-        else:
-            path = f"rw/iosystem/signals/{signal}"
-        res_json = self._do_get(path)
+        res_json = self._do_get(self._io_url(signal, network, unit))
         value = res_json["_embedded"]["resources"][0]["lvalue"]
         return value
 
@@ -423,8 +716,103 @@ class RWS2:
         :param unit: The device unit of the signal. If the device is <none> leave default value ''.
         :return: The value of the signal. Typically 1 for ON and 0 for OFF
         """
+        cached = self._signal_values.get(signal)
+        if cached is not None:
+            return cached
         value = self.get_io(signal, network, unit)
-        return int(value)
+        return 1 if value == "1" else 0
+
+    def _get_ios(self, signals: Sequence[str], network: str = "", unit: str = "") -> Dict[str, str]:
+        # Read the signal listing once and pick out the requested signals, following pages until all are
+        # found. Signals missing from the listing fall back to a single-signal GET.
+        wanted = set(signals)
+        values: Dict[str, str] = {}
+        relative_url: Optional[str] = "rw/iosystem/signals"
+        params = {"network": network, "device": unit or "DRV_1"} if network else None
+        while relative_url is not None and len(values) < len(wanted):
+            res_json = self._do_get(relative_url, params)
+            if res_json is None:
+                break
+            for r in res_json["_embedded"]["resources"]:
+                name = r.get("name")
+                if name in wanted:
+                    values[name] = r["lvalue"]
+            next_link = res_json.get("_links", {}).get("next")
+            if next_link is None:
+                break
+            # The next link carries the query, including any network/device filter
+            relative_url = urllib.parse.urljoin(relative_url, next_link["href"]).lstrip("/")
+            params = None
+        for signal in wanted.difference(values):
+            values[signal] = self.get_io(signal, network, unit)
+        return values
+
+    def get_digital_ios(self, signals: Sequence[str], network: str = "", unit: str = "") -> Dict[str, int]:
+        """
+        Get the values of several digital IO signals with a single request to the signal listing, instead
+        of one request per signal. Signals with an active subscription are served from the pushed values.
+
+        :param signals: The names of the signals
+        :param network: The network the signals are on. If the Network is <none> leave default value ''.
+        :param unit: The device unit of the signals. If the device is <none> leave default value ''.
+        :return: Mapping of signal name to value. Typically 1 for ON and 0 for OFF
+        """
+        out = {s: self._signal_values[s] for s in signals if s in self._signal_values}
+        pending = [s for s in signals if s not in out]
+        if pending:
+            for name, value in self._get_ios(pending, network, unit).items():
+                out[name] = 1 if value == "1" else 0
+        return {s: out[s] for s in signals}
+
+    def subscribe_digital_io(
+        self, signals: Sequence[str], callback: Callable[[str, int], None], network: str = "", unit: str = ""
+    ) -> RWSSubscription:
+        """
+        Subscribe to value changes of one or more digital IO signals. While the subscription is open,
+        get_digital_io() returns the last value pushed by the controller instead of issuing a GET.
+
+        The returned `RWSSubscription` holds a persistent websocket connection to the controller. It must
+        be closed with the close() method when no longer in use.
+
+        :param signals: The names of the signals
+        :param callback: Called with `(signal_name, value)` on every signal change
+        :param network: The network the signals are on. If the Network is <none> leave default value ''.
+        :param unit: The device unit of the signals. If the device is <none> leave default value ''.
+        :return: Active subscription
+        """
+        payload = {"resources": [str(i + 1) for i in range(len(signals))]}
+        for i, signal in enumerate(signals, start=1):
+            payload[str(i)] = f"/{self._io_url(signal, network, unit)};state"
+            payload[f"{i}-p"] = str(SubscriptionResourcePriority.High.value)
+
+        res = self._session.post(self._urls["subscription"], data=payload, timeout=self._timeout)
+        try:
+            if res.status_code != 201:
+                raise ABBException("Subscription creation failed", res.status_code)
+            ws_url = res.headers.get("Location")
+            if ws_url is None:
+                m = re.search(r"(/poll/\d+)", res.text)
+                if m is None:
+                    raise ABBException("Invalid subscription response", res.status_code)
+                ws_url = re.sub(r"^http", "ws", self.base_url) + m.group(1)
+        finally:
+            res.close()
+
+        subscribed = set(signals)
+
+        def _handler(evt):
+            if isinstance(evt, _SignalEvent):
+                value = 1 if evt.lvalue == "1" else 0
+                self._signal_values[evt.name] = value
+                callback(evt.name, value)
+            elif isinstance(evt, (SubscriptionClosed, SubscriptionException)):
+                # Fall back to HTTP reads once the push channel is gone
+                for name in subscribed:
+                    self._signal_values.pop(name, None)
+
+        cookie = "; ".join(f"{c.name}={c.value}" for c in self._session.cookies)
+        header = {"Cookie": cookie, "Authorization": _basic_auth_str(self.username, self.password)}
+        return RWSSubscription(ws_url, header, _handler, subprotocol="rws_subscription")
 
     def set_digital_io(self, signal: str, value: bool | int, network: str = "", unit: str = ""):
         """
@@ -435,13 +823,10 @@ class RWS2:
         :param network: The network the signal is on. The default `Local` will work for most signals.
         :param unit: The drive unit of the signal. The default `DRV_1` will work for most signals.
         """
-        lvalue = "1" if bool(value) else "0"
-        payload = {"lvalue": lvalue}
-        if network:
-            path = f"rw/iosystem/signals/{network}/{unit or 'DRV_1'}/{signal}"
-        else:
-            path = f"rw/iosystem/signals/{signal}"
-        _res = self._do_post(f"{path}/set-value?mastership=implicit", payload)
+        payload = b"lvalue=1" if bool(value) else b"lvalue=0"
+        # Drop any pushed value so reads go to the controller until the subscription reports the change
+        self._signal_values.pop(signal, None)
+        _res = self._do_post(self._io_url(signal, network, unit, "/set-value?mastership=implicit"), payload)
 
     def pulse_digital_io(self, signal: str, duration: int, network: str = "", unit: str = ""):
         """
@@ -453,11 +838,8 @@ class RWS2:
         :param unit: The drive unit of the signal. The default `DRV_1` will work for most signals.
         """
         payload = {"lvalue": "1", "mode": "pulse", "Pulses": "1", "ActivePulse": duration}
-        if network:
-            path = f"rw/iosystem/signals/{network}/{unit or 'DRV_1'}/{signal}"
-        else:
-            path = f"rw/iosystem/signals/{signal}"
-        _res = self._do_post(f"{path}/set-value?mastership=implicit", payload)
+        self._signal_values.pop(signal, None)
+        _res = self._do_post(self._io_url(signal, network, unit, "/set-value?mastership=implicit"), payload)
 
     def get_analog_io(self, signal: str, network: str = "", unit: str = "") -> float:
         """
@@ -471,6 +853,19 @@ class RWS2:
         value = self.get_io(signal, network, unit)
         return float(value)
 
+    def get_analog_ios(self, signals: Sequence[str], network: str = "", unit: str = "") -> Dict[str, float]:
+        """
+        Get the values of several analog IO signals with a single request to the signal listing, instead
+        of one request per signal.
+
+        :param signals: The names of the signals
+        :param network: The network the signals are on. The default `Local` will work for most signals.
+        :param unit: The drive unit of the signals. The default `DRV_1` will work for most signals.
+        :return: Mapping of signal name to value
+        """
+        values = self._get_ios(signals, network, unit)
+        return {s: float(values[s]) for s in signals}
+
     def set_analog_io(self, signal: str, value: Union[int, float], network: str = "", unit: str = ""):
         """
         Set the value of an analog IO signal.
@@ -481,17 +876,13 @@ class RWS2:
         :param unit: The drive unit of the signal. The default `DRV_1` will work for most signals.
         """
         payload = {"mode": "value", "lvalue": value}
-        if network:
-            path = f"rw/iosystem/signals/{network}/{unit or 'DRV_1'}/{signal}"
-        else:
-            path = f"rw/iosystem/signals/{signal}"
-        _res = self._do_post(f"{path}/set-value?mastership=implicit", payload)
+        _res = self._do_post(self._io_url(signal, network, unit, "/set-value?mastership=implicit"), payload)
 
     def get_group_io(self, signal: str, network: str = "", unit: str = "") -> int:
         """
-        This is the same as get_digital_io(). Get the value of a group IO signal.
+        Get the value of a group IO signal.
         """
-        return self.get_digital_io(signal, network, unit)
+        return int(self.get_io(signal, network, unit))
 
     def set_group_io(self, signal: str, value: int, network: str = "", unit: str = ""):
         """
@@ -505,11 +896,7 @@ class RWS2:
         """
         lvalue = value
         payload = {"lvalue": lvalue}
-        if network:
-            path = f"rw/iosystem/signals/{network}/{unit or 'DRV_1'}/{signal}"
-        else:
-            path = f"rw/iosystem/signals/{signal}"
-        url = f"{path}/set-value?mastership=implicit"
+        url = self._io_url(signal, network, unit, "/set-value?mastership=implicit")
         logger.debug(f"set_group_io signal={signal} value={lvalue} url={url}")
         _res = self._do_post(url, payload)
 
@@ -538,16 +925,35 @@ class RWS2:
 
     def get_rapid_variable(self, var: str, task: str = "T_ROB1") -> str:
         """
-        Get value of a RAPID pers variable
+        Get value of a RAPID pers variable. Values are cached for a short time (20 ms by default) and
+        invalidated when the variable is written through this client.
 
         :param var: The pers variable name
         :param task: The task containing the pers variable
         :return: The pers variable encoded as a string
         """
-        res_json = self._do_get(f"rw/rapid/symbol/RAPID/{task}/{var}/data?mastership=implicit")
+        key = (task, var)
+        cached = self._pers_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._pers_ttl:
+            return cached[1]
+        gen = (self._pers_epoch, self._pers_gen.get(key, 0))
+        res_json = self._do_get(self._rapid_symbol_url(var, task))
         state = res_json["state"][0]["value"]
+        if gen == (self._pers_epoch, self._pers_gen.get(key, 0)):
+            self._pers_cache[key] = (time.monotonic(), state)
         return state
 
+    def _invalidate_pers(self, key: Tuple[Optional[str], str]) -> None:
+        self._pers_gen[key] = self._pers_gen.get(key, 0) + 1
+        self._pers_cache.pop(key, None)
+
+    def invalidate_rapid_cache(self) -> None:
+        """
+        Drop all cached RAPID pers variable values read by get_rapid_variable()
+        """
+        self._pers_epoch += 1
+        self._pers_cache.clear()
+
     def set_rapid_variable(self, var: str, value: str, task: str = "T_ROB1"):
         """
         Set value of a RAPID pers variable
@@ -557,13 +963,30 @@ class RWS2:
         :param task: The task containing the pers variable
         """
         payload = {"value": value}
-        if task is not None:
-            var1 = f"{task}/{var}"
-        else:
-            var1 = var
-        self.request_mastership()
-        _res = self._do_post(f"rw/rapid/symbol/RAPID/{var1}/data?mastership=implicit", payload)
-        self.release_mastership()
+        url = self._rapid_symbol_url(var, task)
+        key = (task, var)
+        # Invalidate before and after the write, so reads overlapping it on either side are not cached
+        self._invalidate_pers(key)
+        try:
+            if self._mastership_held:
+                _res = self._do_post(url, payload)
+                return
+            self.request_mastership()
+            _res = self._do_post(url, payload)
+            self.release_mastership()
+        finally:
+            self._invalidate_pers(key)
+
+    def set_rapid_variables(self, values: Dict[str, str], task: str = "T_ROB1"):
+        """
+        Set the values of multiple RAPID pers variables while holding mastership once
+
+        :param values: Mapping of pers variable name to the new value encoded as a string
+        :param task: The task containing the pers variables
+        """
+        with self.mastership():
+            for var, value in values.items():
+                self.set_rapid_variable(var, value, task)
 
     def _rws_value_to_wobjdata(self, val: str) -> WObjData:
         m = re.match(
@@ -748,14 +1171,14 @@ class RWS2:
         :param directory: The directory to write the file to, e.g. $HOME
         """
         if directory:  # used for RWS 1 backwards compatibility with abb_motion_exec
-            url = f"{self.base_url}/fileservice/{directory}/{filename}"
+            res = self._do_put(f"fileservice/{directory}/{filename}", contents)
         else:
-            url = f"{self.base_url}/fileservice/{filename}"
-        header = {"Content-Type": "text/plain;v=2.0"}
-        res = self._session.put(url, contents, auth=self.auth, headers=header)
-        if not res.ok:
-            raise Exception(res.reason)
-        res.close()
+            res = self._do_put(f"fileservice/{filename}", contents)
+        try:
+            if not res.ok:
+                raise Exception(res.reason)
+        finally:
+            res.close()
 
     def delete_file(self, filename: str, directory: str = "") -> None:
         """
@@ -764,10 +1187,9 @@ class RWS2:
         :param filename: The filename to delete
         """
         if directory:  # used for RWS 1 backwards compatibility with abb_motion_exec
-            url = f"{self.base_url}/fileservice/{directory}/{filename}"
+            res = self._do_delete(f"fileservice/{directory}/{filename}")
         else:
-            url = f"{self.base_url}/fileservice/{filename}"
-        res = self._session.delete(url, auth=self.auth, headers=self.header)
+            res = self._do_delete(f"fileservice/{filename}")
         res.close()
 
     # def list_files(self, path: str) -> List[str]:
@@ -788,57 +1210,53 @@ class RWS2:
         :param elog: The event log id to read
         :return: The event log entries
         """
-        o = []
-        res_json = self._do_get("rw/elog/" + str(elog) + "/?lang=en")
-        log = res_json["_embedded"]["resources"]
-
-        for log_entry in log:
-            entry_dict = {
-                "seqnum": int(log_entry["_title"].split("/")[-1]),
-                "msgtype": int(log_entry["msgtype"]),
-                "code": int(log_entry["code"]),
-                "tstamp": datetime.datetime.strptime(log_entry["tstamp"], "%Y-%m-%d T %H:%M:%S"),
-                "title": log_entry["title"],
-                "desc": log_entry["desc"],
-                "conseqs": log_entry["conseqs"],
-                "causes": log_entry["causes"],
-                "actions": log_entry["actions"],
-                "args": [],
-            }
-            _nargs = int(log_entry["argc"])
-            if "argv" in log_entry:
-                for arg in log_entry["argv"]:
-                    entry_dict["args"].append(arg["value"])
-            o.append(EventLogEntry.model_validate(entry_dict))
-
-        return o
+        res_bytes = self._do_get_bytes("rw/elog/" + str(elog) + "/?lang=en")
+        # Parse, coerce and validate every entry in a single pass over the response bytes
+        log = _EventLogResponse.model_validate_json(res_bytes).embedded.resources
+
+        return [
+            EventLogEntry.model_construct(
+                seqnum=int(e.title_path.rsplit("/", 1)[-1]),
+                msgtype=e.msgtype,
+                code=e.code,
+                tstamp=e.tstamp,
+                args=[arg.value for arg in e.argv],
+                title=e.title,
+                desc=e.desc,
+                conseqs=e.conseqs,
+                causes=e.causes,
+                actions=e.actions,
+            )
+            for e in log
+        ]
 
     def get_tasks(self) -> dict[str, TaskState]:
         """
-        Get controller tasks and task state
+        Get controller tasks and task state. Results are cached for a short time and invalidated by
+        start(), stop(), activate_task() and deactivate_task().
 
         :return: The tasks and task state
         """
+        if self._tasks_cache is not None:
+            cache_t, cached = self._tasks_cache
+            if time.monotonic() - cache_t < self._tasks_cache_ttl:
+                return dict(cached)
         o = {}
-        res_json = self._do_get("rw/rapid/tasks")
-        if res_json is None:
+        res_bytes = self._do_get_bytes("rw/rapid/tasks")
+        if res_bytes is None:
             return o
-        resources = res_json["_embedded"]["resources"]
+        # Validate straight from the response bytes; "On"/"Off" flags are coerced to bool by pydantic
+        resources = _TaskListResponse.model_validate_json(res_bytes).embedded.resources
         for s in resources:
-            if "name" not in s:
+            if not isinstance(s, TaskState):
+                if "name" in s:
+                    logger.warning("Failed to parse task: {}", s["name"])
                 continue  # skip non-task resources
-            if s.get("name") == "SC_CBC":
+            if s.name == "SC_CBC":
                 continue
-            try:
-                task_data = dict(s)
-                if "active" in task_data and isinstance(task_data["active"], str):
-                    task_data["active"] = task_data["active"].strip().lower() in {"on", "true", "1"}
-                if "motiontask" in task_data and isinstance(task_data["motiontask"], str):
-                    task_data["motiontask"] = task_data["motiontask"].strip().lower() in {"on", "true", "1"}
-                o[s["name"]] = TaskState.model_validate(task_data)
-            except Exception as e:
-                print(f"Failed to parse task: {s.get('name', '<unknown>')}, error: {e}")
-        return o
+            o[s.name] = s
+        self._tasks_cache = (time.monotonic(), o)
+        return dict(o)
 
     def get_jointtarget(self, task: str = "T_ROB1") -> JointTarget:
         """
@@ -855,28 +1273,8 @@ class RWS2:
             raise Exception("No joint target state found")
 
         joint_data = state_list[0]
-        robjoint = np.array(
-            [
-                joint_data["rax_1"],
-                joint_data["rax_2"],
-                joint_data["rax_3"],
-                joint_data["rax_4"],
-                joint_data["rax_5"],
-                joint_data["rax_6"],
-            ],
-            dtype=np.float64,
-        )
-        extjoint = np.array(
-            [
-                joint_data["eax_a"],
-                joint_data["eax_b"],
-                joint_data["eax_c"],
-                joint_data["eax_d"],
-                joint_data["eax_e"],
-                joint_data["eax_f"],
-            ],
-            dtype=np.float64,
-        )
+        robjoint = np.array(_ROBAX_KEYS(joint_data), dtype=np.float64)
+        extjoint = np.array(_EXTAX_KEYS(joint_data), dtype=np.float64)
         return JointTarget(robax=robjoint, extax=extjoint)
 
     def get_robtarget(self, mechunit="ROB_1", tool="tool0", wobj="wobj0", coordinate="Base") -> RobTarget:
@@ -894,13 +1292,10 @@ class RWS2:
             f"rw/motionsystem/mechunits/{mechunit}/robtarget?tool={tool}&wobj={wobj}&coordinate={coordinate}"
         )
         state = res_json["state"][0]
-        trans = np.array([state["x"], state["y"], state["z"]], dtype=np.float64)
-        rot = np.array([state["q1"], state["q2"], state["q3"], state["q4"]], dtype=np.float64)
-        robconf = np.array([state["cf1"], state["cf4"], state["cf6"], state["cfx"]], dtype=np.float64)
-        extax = np.array(
-            [state["eax_a"], state["eax_b"], state["eax_c"], state["eax_d"], state["eax_e"], state["eax_f"]],
-            dtype=np.float64,
-        )
+        trans = np.array(_TRANS_KEYS(state), dtype=np.float64)
+        rot = np.array(_ROT_KEYS(state), dtype=np.float64)
+        robconf = np.array(_ROBCONF_KEYS(state), dtype=np.float64)
+        extax = np.array(_EXTAX_KEYS(state), dtype=np.float64)
         return RobTarget(trans, rot, robconf, extax)
 
     def get_mechunits(self) -> List[str]:
@@ -1006,7 +1401,7 @@ class RWS2:
     #     :param value: The new variable float array value
     #     :param task: The task containing the pers variable
     #     """
-    #     self.set_rapid_variable(var, "[" + ','.join([str(s) for s in val]) + "]", task)
+    #     self.set_rapid_variable(var, "[" + ','.join(map(str, val)) + "]", task)
 
     def read_ipc_message(self, queue_name: str, timeout: float = 0) -> List[IpcMessage]:
         """
@@ -1019,7 +1414,11 @@ class RWS2:
         """
         o = []
 
-        res_json = self._do_get(f"rw/dipc/{queue_name}/{timeout}")
+        # The controller holds the request open for up to `timeout` seconds, so extend the read timeout by it
+        connect, read = self._split_timeout()
+        res_json = self._do_get(f"rw/dipc/{queue_name}/{timeout}", timeout=(connect, read + timeout))
+        if res_json is None:
+            raise ABBException(f"Failed to read IPC queue {queue_name}", 0)
         for state in res_json["_embedded"]["_state"]:
             if not state["_type"] == "dipc-read-li":
                 raise Exception("Invalid IPC message type")
@@ -1152,43 +1551,18 @@ class RWS2:
     #     # A "persistent session" can only make 400 calls before
     #     # being disconnected. Once this connection is lost,
     #     # the grant will be revoked. To work around this,
-    #     # create parallel sessions with copied session cookies
-    #     # to maintain the connection.
-
-    #     url="/".join([self.base_url, 'users/rmmp/poll?json=1'])
+    #     # drop the pooled connections every 30 s. The session
+    #     # keeps its cookies and reconnects on the next request.
 
-    #     old_rmmp_session=None
-    #     if self._rmmp_session is None:
-    #         self._do_get(url)
-    #         self._rmmp_session=requests.Session()
-    #         self._rmmp_session_t=time.time()
+    #     if time.monotonic() - self._rmmp_session_t > 30:
+    #         self._session.close()
+    #         self._rmmp_session_t = time.monotonic()
 
-    #         for c in self._session.cookies:
-    #             self._rmmp_session.cookies.set_cookie(c)
-    #     else:
-    #         if time.time() - self._rmmp_session_t > 30:
-    #             old_rmmp_session=self._rmmp_session
-    #             rmmp_session=requests.Session()
-
-    #             for c in self._session.cookies:
-    #                 rmmp_session.cookies.set_cookie(c)
-
-    #     rmmp_session=self._rmmp_session
-
-    #     res=rmmp_session.get(url, auth=self.auth)
-    #     res_json=self._process_response(res)
+    #     res_json = self._do_get("users/rmmp/poll")
     #     state = res_json["_embedded"]["_state"][0]
     #     if not state["_type"] == "user-rmmp-poll":
     #         raise Exception("Invalid rmmp poll type")
 
-    #     if old_rmmp_session is not None:
-    #         self._rmmp_session=rmmp_session
-    #         self._rmmp_session_t=time.time()
-    #         try:
-    #             old_rmmp_session.close()
-    #         except:
-    #             pass
-
     #     return state["status"] == "GRANTED"
 
     ################ new #####################
@@ -1196,41 +1570,51 @@ class RWS2:
         """
         Request mastership for the client
 
+        :return: True if mastership was granted. False if the controller refused it, e.g. with 403 when
+                 another client holds mastership
         """
-        _response = self._session.post(
-            f"{self.base_url}/rw/mastership/request",
-            headers=self.header,
-            auth=self.auth,
-            data="",
-            verify=self._session.verify,
-        )
-        try:
-            _response.raise_for_status()
+        status = self._post_status(self._urls["mastership_request"])
+        if status == 204:
             return True
-        except requests.RequestException as e:
-            status = getattr(_response, "status_code", None)
+        if status == 403:
+            logger.debug("Explicit mastership request denied status=403")
+            return False
+        if status >= 400:
             # Some controllers reject explicit request endpoint; keep fallback non-fatal.
-            logger.debug(f"Explicit mastership request failed status={status}: {e}")
+            logger.debug(f"Explicit mastership request failed status={status}")
             return False
-        finally:
-            _response.close()
+        return True
 
-    def release_mastership(self) -> None:
+    @contextmanager
+    def mastership(self) -> Iterator[None]:
         """
-        Release mastership for the client
+        Hold mastership for the duration of a ``with`` block. Writes issued inside the block skip the
+        per-call mastership request and release.
         """
-        _response = self._session.post(
-            f"{self.base_url}/rw/mastership/release",
-            headers=self.header,
-            auth=self.auth,
-            verify=self._session.verify,
-        )
+        if self._mastership_held:
+            yield
+            return
+        self.request_mastership()
+        self._mastership_held = True
         try:
-            _response.raise_for_status()
-        except requests.RequestException:
-            logger.debug("Failed to release mastership cleanly")
+            yield
         finally:
-            _response.close()
+            self._mastership_held = False
+            self.release_mastership()
+
+    def release_mastership(self) -> bool:
+        """
+        Release mastership for the client
+
+        :return: True if the controller confirmed the release
+        """
+        status = self._post_status(self._urls["mastership_release"])
+        if status == 204:
+            return True
+        if status >= 400:
+            logger.debug(f"Failed to release mastership cleanly status={status}")
+            return False
+        return True
 
 
 def test_RWS2():
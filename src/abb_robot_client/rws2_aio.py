@@ -0,0 +1,258 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+from loguru import logger
+
+from .rws import ABBException, JointTarget, RobTarget
+from .rws2 import (
+    RWS2,
+    RAPIDExecutionState,
+    TaskState,
+    VariableValue,
+    _TaskListResponse,
+    _json,
+    _EXTAX_KEYS,
+    _ROBAX_KEYS,
+    _ROBCONF_KEYS,
+    _ROT_KEYS,
+    _TRANS_KEYS,
+)
+
+
+class RWS2_AIO:
+    """
+    Robot Web Services 2.0 asyncio client. This class provides the read paths of
+    :class:`abb_robot_client.rws2.RWS2` using asyncio, so that several independent reads can be issued
+    concurrently over a pooled keep-alive connection instead of one round trip at a time.
+
+    To use, the `abb_robot_client[aio]` option must be installed with pip. HTTP/2 additionally requires
+    `httpx[http2]`; with it enabled, concurrent requests are multiplexed over a single TLS connection.
+
+    :param base_url: Base URL of the robot. For Robot Studio instances, this should be https://127.0.0.1:80,
+                     the default value. For a real robot, 127.0.0.1 should be replaced with the IP address
+                     of the robot controller. The WAN port ethernet must be used, not the maintenance port.
+    :param username: The HTTPS username for the robot. Defaults to 'Default User'
+    :param password: The HTTPS password for the robot. Defaults to 'robotics'
+    :param http2: Negotiate HTTP/2 with the controller. Defaults to False
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://127.0.0.1:80",
+        username: str = "Default User",
+        password: str = "robotics",
+        http2: bool = False,
+    ):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.auth = httpx.BasicAuth(username, password)
+        self.header = {
+            "accept": "application/hal+json;v=2.0",
+            "Content-Type": "application/x-www-form-urlencoded;v=2.0",
+        }
+        self._session = httpx.AsyncClient(
+            base_url=base_url,
+            auth=self.auth,
+            headers=self.header,
+            verify=False,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=http2,
+        )
+
+    async def _do_get(self, relative_url: str, params=None):
+        try:
+            response = await self._session.get(f"/{relative_url}", params=params)
+            response.raise_for_status()
+            return _json.loads(response.content) if response.content else None
+        except (httpx.HTTPError, ValueError) as e:
+            logger.opt(exception=True).error("HTTP GET {} failed: {}", relative_url, e)
+            return None
+
+    async def _do_get_bytes(self, relative_url: str, params=None) -> Optional[bytes]:
+        try:
+            response = await self._session.get(f"/{relative_url}", params=params)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPError as e:
+            logger.opt(exception=True).error("HTTP GET {} failed: {}", relative_url, e)
+            return None
+
+    async def get_many(self, calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """
+        Issue several GET requests concurrently and return the decoded responses in the same order
+
+        :param calls: Sequence of `(relative_url, params)` pairs. `params` may be None
+        :return: The decoded JSON responses. Failed requests are returned as None
+        """
+        if calls and not self._session.cookies:
+            # Let the first request establish the controller session so the concurrent ones share its cookie
+            # instead of each opening a session of their own
+            first = await self._do_get(*calls[0])
+            rest = await asyncio.gather(*[self._do_get(url, params) for url, params in calls[1:]])
+            return [first, *rest]
+        return await asyncio.gather(*[self._do_get(url, params) for url, params in calls])
+
+    async def get_execution_state(self) -> RAPIDExecutionState:
+        """
+        Get the RAPID execution state
+
+        :return: The RAPID execution state
+        """
+        res_json = await self._do_get("rw/rapid/execution")
+        state = res_json["state"][0]
+        return RAPIDExecutionState(ctrlexecstate=state["ctrlexecstate"], cycle=state["cycle"])
+
+    async def get_controller_state(self) -> str:
+        """
+        Get the controller state. See :meth:`abb_robot_client.rws2.RWS2.get_controller_state()`
+
+        :return: The controller state
+        """
+        res_json = await self._do_get("rw/panel/ctrl-state")
+        return res_json["state"][0]["ctrlstate"]
+
+    async def get_operation_mode(self) -> str:
+        """
+        Get the controller operational mode. See :meth:`abb_robot_client.rws2.RWS2.get_operation_mode()`
+
+        :return: The controller operational mode.
+        """
+        res_json = await self._do_get("rw/panel/opmode")
+        return res_json["state"][0]["opmode"]
+
+    async def get_speedratio(self) -> int:
+        """
+        Get the current speed ratio
+
+        :return: The current speed ratio between 0% - 100%
+        """
+        res_json = await self._do_get("rw/panel/speedratio")
+        state = res_json["state"][0]
+        if not state["_type"] == "pnl-speedratio":
+            raise Exception("Invalid speedratio type")
+        return int(state["speedratio"])
+
+    async def get_tasks(self) -> Dict[str, TaskState]:
+        """
+        Get controller tasks and task state
+
+        :return: The tasks and task state
+        """
+        o = {}
+        res_bytes = await self._do_get_bytes("rw/rapid/tasks")
+        if res_bytes is None:
+            return o
+        for s in _TaskListResponse.model_validate_json(res_bytes).embedded.resources:
+            if isinstance(s, TaskState) and s.name != "SC_CBC":
+                o[s.name] = s
+        return o
+
+    async def get_jointtarget(self, task: str = "T_ROB1") -> JointTarget:
+        """
+        Get the current joint target of the specified task.
+
+        :param task: The name of the task to get the joint target from.
+        :return: The current joint target.
+        """
+        res_json = await self._do_get(f"rw/rapid/tasks/{task}/motion/jointtarget")
+        if res_json is None:
+            raise Exception("Failed to get joint target")
+        state_list = res_json.get("state", [])
+        if not state_list:
+            raise Exception("No joint target state found")
+        joint_data = state_list[0]
+        return JointTarget(
+            robax=np.array(_ROBAX_KEYS(joint_data), dtype=np.float64),
+            extax=np.array(_EXTAX_KEYS(joint_data), dtype=np.float64),
+        )
+
+    async def get_robtarget(self, mechunit="ROB_1", tool="tool0", wobj="wobj0", coordinate="Base") -> RobTarget:
+        """
+        Get the current robtarget (cartesian pose) for the specified mechunit
+
+        :param mechunit: The mechanical unit to read
+        :param tool: The tool to use to compute robtarget
+        :param wobj: The wobj to use to compute robtarget
+        :param coordinate: The coordinate system to use to compute robtarget. Can be `Base`, `World`, `Tool`, or `Wobj`
+        :return: The current robtarget
+        """
+        res_json = await self._do_get(
+            f"rw/motionsystem/mechunits/{mechunit}/robtarget?tool={tool}&wobj={wobj}&coordinate={coordinate}"
+        )
+        state = res_json["state"][0]
+        return RobTarget(
+            np.array(_TRANS_KEYS(state), dtype=np.float64),
+            np.array(_ROT_KEYS(state), dtype=np.float64),
+            np.array(_ROBCONF_KEYS(state), dtype=np.float64),
+            np.array(_EXTAX_KEYS(state), dtype=np.float64),
+        )
+
+    async def get_rapid_variable(self, var: str, task: str = "T_ROB1") -> str:
+        """
+        Get value of a RAPID pers variable
+
+        :param var: The pers variable name
+        :param task: The task containing the pers variable
+        :return: The pers variable encoded as a string
+        """
+        res_json = await self._do_get(RWS2._rapid_symbol_url(var, task))
+        return res_json["state"][0]["value"]
+
+    async def batch_get_rapid_variables(self, vars: Sequence[str], task: str = "T_ROB1") -> List[VariableValue]:
+        """
+        Get the values of several RAPID pers variables concurrently
+
+        :param vars: The pers variable names
+        :param task: The task containing the pers variables
+        :return: The pers variable values, in the same order as `vars`
+        """
+        res = await self.get_many([(RWS2._rapid_symbol_url(var, task), None) for var in vars])
+        o = []
+        for var, res_json in zip(vars, res):
+            if res_json is None:
+                raise ABBException(f"Failed to read RAPID variable {task}/{var}", 0)
+            o.append(VariableValue(name=var, value=res_json["state"][0]["value"], task=task))
+        return o
+
+    async def get_io(self, signal: str, network: str = "", unit: str = ""):
+        """
+        Get the value of an IO signal.
+
+        :param signal: The name of the signal
+        :param network: The network the signal is on. If the Network is <none> leave default value ''.
+        :param unit: The device unit of the signal. If the device is <none> leave default value ''.
+        :return: The value of the signal. Typically 1 for ON and 0 for OFF
+        """
+        res_json = await self._do_get(RWS2._io_url(signal, network, unit))
+        return res_json["_embedded"]["resources"][0]["lvalue"]
+
+    async def get_digital_io(self, signal: str, network: str = "", unit: str = "") -> int:
+        """
+        Get the value of a digital IO signal.
+
+        :param signal: The name of the signal
+        :param network: The network the signal is on. If the Network is <none> leave default value ''.
+        :param unit: The device unit of the signal. If the device is <none> leave default value ''.
+        :return: The value of the signal. Typically 1 for ON and 0 for OFF
+        """
+        return int(await self.get_io(signal, network, unit))
+
+    async def get_analog_io(self, signal: str, network: str = "", unit: str = "") -> float:
+        """
+        Get the value of an analog IO signal.
+
+        :param signal: The name of the signal
+        :param network: The network the signal is on. If the Network is <none> leave default value ''.
+        :param unit: The device unit of the signal. If the device is <none> leave default value ''.
+        :return: The value of the signal
+        """
+        return float(await self.get_io(signal, network, unit))
+
+    async def close(self):
+        """
+        Close the underlying HTTP connection pool
+        """
+        await self._session.aclose()
@@ -37,6 +37,7 @@ from .rws import (
     VariableValue,
     SubscriptionResourceType,
     SubscriptionResourceRequest,
+    _json,
 )
 
 
@@ -102,7 +103,7 @@ class RWS_AIO:
         response_json = None
         if response.headers["Content-Type"] == "application/json" and len(response.content) > 0:
             try:
-                response_json = response.json()
+                response_json = _json.loads(response.content)
             except:
                 if not response.text.startswith("<?xml"):
                     raise
@@ -623,7 +624,7 @@ class RWS_AIO:
         :param value: The new variable float array value
         :param task: The task containing the pers variable
         """
-        await self.set_rapid_variable(var, "[" + ",".join([str(s) for s in val]) + "]", task)
+        await self.set_rapid_variable(var, "[" + ",".join(map(str, val)) + "]", task)
 
     async def read_ipc_message(self, queue_name: str, timeout: float = 0) -> List[IpcMessage]:
         """
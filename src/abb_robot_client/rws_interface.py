@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Protocol, runtime_checkable
+from typing import Any, Mapping, Protocol, Sequence, runtime_checkable
 from .rws import JointTarget, RobTarget
 
 
@@ -33,7 +33,7 @@ class RWSLike(Protocol):
     """Minimal shared interface across RWS, RWS2, and mock implementations."""
 
     # Execution / state
-    def start(self, cycle: str = "asis", tasks: List[str] | None = None) -> None: ...
+    def start(self, cycle: str = "asis", tasks: Sequence[str] | None = None) -> None: ...
     def stop(self) -> None: ...
     def resetpp(self) -> None: ...
     def get_execution_state(self) -> RAPIDExecutionStateLike: ...
@@ -47,7 +47,7 @@ class RWSLike(Protocol):
     def is_mastered(self) -> bool: ...
 
     # Tasks
-    def get_tasks(self) -> Dict[str, TaskStateLike]: ...
+    def get_tasks(self) -> Mapping[str, TaskStateLike]: ...
     def activate_task(self, task: str) -> None: ...
     def deactivate_task(self, task: str) -> None: ...
 
@@ -71,8 +71,8 @@ class RWSLike(Protocol):
     def delete_file(self, filename: str) -> None: ...
 
     # Misc
-    def read_event_log(self) -> List[EventLogEntryLike]: ...
-    def get_mechunits(self) -> List[str]: ...
+    def read_event_log(self) -> Sequence[EventLogEntryLike]: ...
+    def get_mechunits(self) -> Sequence[str]: ...
 
     # Geometry
     def get_jointtarget(self, mechunit: str = "ROB_1") -> JointTarget: ...
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import functools
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import numpy as np
 
@@ -10,13 +13,15 @@ from .rws_interface import RWSLike, TaskStateLike, RAPIDExecutionStateLike, Even
 from .rws import JointTarget, RobTarget, ToolData, WObjData
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _ExecState:
     ctrlexecstate: Any
     cycle: Any
 
 
 class _TaskState:
+    __slots__ = ("name", "_type_val", "taskstate", "excstate", "active", "motiontask")
+
     def __init__(
         self,
         name: str,
@@ -38,7 +43,7 @@ class _TaskState:
         return self._type_val
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _EventLogEntry:
     seqnum: int
     msgtype: int
@@ -60,6 +65,8 @@ class RWSMock(RWSLike):
     it can stand in for `rws.RWS` or `rws2.RWS2` in tests or local runs.
     """
 
+    _valid_ctrl_states = frozenset({"motoron", "motoroff"})
+
     def __init__(self) -> None:
         self._exec_state = "stopped"
         self._speedratio = 100
@@ -70,6 +77,15 @@ class RWSMock(RWSLike):
                 "T_ROB1", type_val="NORMAL", taskstate="ready", excstate=self._exec_state, active=True, motiontask=True
             )
         }
+        self._tasks_view: Mapping[str, _TaskState] = MappingProxyType(self._tasks)
+        self._mechunits: Tuple[str, ...] = ("ROB_1",)
+        # Constant geometry payloads, shared by every call and marked read-only so callers cannot alias-modify them
+        self._zeros6 = np.zeros(6, dtype=np.float64)
+        self._zeros3 = np.zeros(3, dtype=np.float64)
+        self._ident_quat = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float64)
+        self._robconf = np.zeros(4, dtype=np.float64)
+        for a in (self._zeros6, self._zeros3, self._ident_quat, self._robconf):
+            a.setflags(write=False)
         # IO state
         self._dio: Dict[str, int] = {
             "Auto": 1,
@@ -84,11 +100,27 @@ class RWSMock(RWSLike):
             "T_ROB1/MOTION_PROGRAM_CMD_MOVEL": "3",
             "T_ROB1/test_num": "0",
         }
-        # Filesystem (simple virtual store keyed by path)
-        self._files: Dict[str, bytes] = {
-            "$HOME/motion_program_exec.mod": b"MODULE motion_program_exec\nENDMODULE\n",
-            "/TEMP/motion_program_exec.mod": b"MODULE motion_program_exec\nENDMODULE\n",
+        # Parsed numeric arrays keyed like _rapid; entries are dropped whenever the variable is written
+        self._rapid_np_cache: Dict[str, np.ndarray] = {}
+        # Filesystem (simple virtual store keyed by path, holding (hash, content) so unchanged uploads are skipped)
+        _mod = b"MODULE motion_program_exec\nENDMODULE\n"
+        self._files: Dict[str, Tuple[int, bytes]] = {
+            "$HOME/motion_program_exec.mod": (hash(_mod), _mod),
+            "/TEMP/motion_program_exec.mod": (hash(_mod), _mod),
         }
+        # Decoded text of files read through read_file_str, dropped when the path is rewritten or deleted
+        self._files_str: Dict[str, str] = {}
+        # Directory arguments with trailing slashes stripped, filled on first use
+        self._norm_dirs: Dict[str, str] = {}
+        self._event_log: List[_EventLogEntry] = [
+            _EventLogEntry(
+                seqnum=1,
+                msgtype=1,
+                code=0,
+                title="Mock event",
+                desc="This is a mock event log entry",
+            )
+        ]
 
     def ping(self) -> bool:
         return True
@@ -113,7 +145,7 @@ class RWSMock(RWSLike):
         return self._controller_state
 
     def set_controller_state(self, ctrl_state: str) -> None:
-        if ctrl_state not in {"motoron", "motoroff"}:
+        if ctrl_state not in self._valid_ctrl_states:
             raise ValueError("ctrl_state must be 'motoron' or 'motoroff'")
         self._controller_state = ctrl_state
 
@@ -139,8 +171,9 @@ class RWSMock(RWSLike):
         return False
 
     # Tasks
-    def get_tasks(self) -> Dict[str, TaskStateLike]:
-        return dict(self._tasks)
+    def get_tasks(self) -> Mapping[str, TaskStateLike]:
+        # Read-only view; task state is only changed through activate_task/deactivate_task
+        return self._tasks_view
 
     def activate_task(self, task: str) -> None:
         if task in self._tasks:
@@ -154,8 +187,11 @@ class RWSMock(RWSLike):
     def get_digital_io(self, signal: str, network: str = "", unit: str = "") -> int:
         return int(self._dio.get(signal, 0))
 
+    def get_digital_ios(self, signals: Sequence[str], network: str = "", unit: str = "") -> Dict[str, int]:
+        return {s: int(self._dio.get(s, 0)) for s in signals}
+
     def set_digital_io(self, signal: str, value: bool | int, network: str = "", unit: str = "") -> None:
-        self._dio[signal] = 1 if bool(value) else 0
+        self._dio[sys.intern(signal)] = 1 if bool(value) else 0
 
     def pulse_digital_io(self, signal: str, duration: int, network: str = "", unit: str = ""):
         self._dio[signal] = 1
@@ -165,17 +201,22 @@ class RWSMock(RWSLike):
     def get_analog_io(self, signal: str, network: str = "", unit: str = "") -> float:
         return float(self._aio.get(signal, 0.0))
 
+    def get_analog_ios(self, signals: Sequence[str], network: str = "", unit: str = "") -> Dict[str, float]:
+        return {s: float(self._aio.get(s, 0.0)) for s in signals}
+
     def set_analog_io(self, signal: str, value: int | float, network: str = "", unit: str = "") -> None:
-        self._aio[signal] = float(value)
+        self._aio[sys.intern(signal)] = float(value)
 
     def get_group_io(self, signal: str, network: str = "", unit: str = "") -> int:
         return int(self._dio.get(signal, 0))
 
     def set_group_io(self, signal: str, value: bool | int, network: str = "", unit: str = "") -> None:
-        self._dio[signal] = value
+        self._dio[sys.intern(signal)] = value
 
     # RAPID variables
-    def _qualify_var(self, var: str, task: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _qualify_var(var: str, task: str) -> str:
         return f"{task}/{var}" if task else var
 
     def get_rapid_variable(self, var: str, task: str = "T_ROB1") -> str:
@@ -186,16 +227,25 @@ class RWSMock(RWSLike):
         return float(self.get_rapid_variable(var, task))
 
     def get_rapid_variable_num_array(self, var: str, task: str = "T_ROB1") -> np.ndarray:
-        val_str = self.get_rapid_variable(var, task)
+        key = self._qualify_var(var, task)
+        arr = self._rapid_np_cache.get(key)
+        if arr is not None:
+            return arr
+        val_str = self._rapid.get(key, "0")
         try:
-            # Assume comma-separated values
-            return np.array([float(v.strip()) for v in val_str.split(",")])
+            # Assume comma-separated values; parsed in a single C loop
+            arr = np.fromstring(val_str, sep=",", dtype=np.float64)
         except ValueError:
-            return np.array([])
+            arr = np.empty(0, dtype=np.float64)
+        # The cached array is shared between callers, so keep it read-only
+        arr.flags.writeable = False
+        self._rapid_np_cache[key] = arr
+        return arr
 
     def set_rapid_variable(self, var: str, value: str | int | float, task: str = "T_ROB1") -> None:
         key = self._qualify_var(var, task)
         self._rapid[key] = str(value)
+        self._rapid_np_cache.pop(key, None)
 
     def set_rapid_variable_num(self, var: str, val: float, task: str = "T_ROB1") -> None:
         self.set_rapid_variable(var, str(val), task)
@@ -243,6 +293,7 @@ class RWSMock(RWSLike):
         key = self._qualify_var(var, task)
         self._rapid_wobj[key] = value
         self._rapid[key] = self._wobjdata_to_rws_value(value)
+        self._rapid_np_cache.pop(key, None)
 
     def get_rapid_variable_tool(self, var: str, task: str = "T_ROB1") -> ToolData:
         key = self._qualify_var(var, task)
@@ -263,6 +314,7 @@ class RWSMock(RWSLike):
         key = self._qualify_var(var, task)
         self._rapid_tool[key] = value
         self._rapid[key] = self._tooldata_to_rws_value(value)
+        self._rapid_np_cache.pop(key, None)
 
     # Files
     def get_ramdisk_path(self) -> str:
@@ -277,60 +329,96 @@ class RWSMock(RWSLike):
         return "ctrl/$HOME"
 
     def _resolve_path(self, filename: str, directory: Optional[str]) -> str:
-        if directory:
-            return f"{directory.rstrip('/')}/{filename.lstrip('/')}"
-        return filename
+        if not directory:
+            return filename
+        norm_dir = self._norm_dirs.get(directory)
+        if norm_dir is None:
+            norm_dir = self._norm_dirs[directory] = directory.rstrip("/")
+        if filename.startswith("/"):
+            filename = filename.lstrip("/")
+        return f"{norm_dir}/{filename}"
 
     def read_file(self, filename: str, directory: str | None = None) -> bytes:
         path = self._resolve_path(filename, directory)
-        data = self._files.get(path)
-        if data is None:
+        entry = self._files.get(path)
+        if entry is None:
             raise FileNotFoundError(f"Path does not exist: {path}")
-        return data
+        return entry[1]
+
+    def read_file_view(self, filename: str, directory: str | None = None) -> memoryview:
+        """
+        Read a file without copying its content
+
+        :param filename: The filename to read
+        :param directory: The directory containing the file
+        :return: A read-only view of the stored file content
+        """
+        return memoryview(self.read_file(filename, directory))
 
     def read_file_str(self, filename: str, directory: str | None = None) -> str:
+        path = self._resolve_path(filename, directory)
+        text = self._files_str.get(path)
+        if text is not None:
+            return text
         try:
-            return self.read_file(filename, directory).decode("utf-8")
+            text = self.read_file(filename, directory).decode("utf-8")
         except FileNotFoundError as e:
             return str(e)
+        self._files_str[path] = text
+        return text
 
     def upload_file(self, filename: str, content: str | bytes, directory: str | None = None) -> None:
         path = self._resolve_path(filename, directory)
         if isinstance(content, str):
             content = content.encode("utf-8")
-        self._files[path] = content
+        h = hash(content)
+        existing = self._files.get(path)
+        if existing is not None and existing[0] == h and existing[1] == content:
+            return
+        self._files[path] = (h, content)
+        self._files_str.pop(path, None)
 
     def delete_file(self, filename: str, directory: str | None = None) -> None:
         path = self._resolve_path(filename, directory)
         if path in self._files:
             del self._files[path]
+        self._files_str.pop(path, None)
 
     # Event log
     def read_event_log(self) -> List[EventLogEntryLike]:
-        return [
-            _EventLogEntry(
-                seqnum=1,
-                msgtype=1,
-                code=0,
-                title="Mock event",
-                desc="This is a mock event log entry",
-            )
-        ]
+        return list(self._event_log)
+
+    def read_event_log_bulk(self) -> Dict[str, np.ndarray]:
+        """
+        Read the event log as columns instead of one object per entry, so callers can filter with
+        vectorized masks, e.g. ``(cols["code"] == 10001) & (cols["msgtype"] == 2)``
+
+        :return: Mapping of field name to a column array, all in event log order
+        """
+        log = self._event_log
+        return {
+            "seqnum": np.fromiter((e.seqnum for e in log), dtype=np.int64, count=len(log)),
+            "msgtype": np.fromiter((e.msgtype for e in log), dtype=np.int64, count=len(log)),
+            "code": np.fromiter((e.code for e in log), dtype=np.int64, count=len(log)),
+            "title": np.array([e.title for e in log], dtype=object),
+            "desc": np.array([e.desc for e in log], dtype=object),
+            "tstamp": np.array([e.tstamp for e in log], dtype=object),
+        }
 
     # Misc
-    def get_mechunits(self) -> List[str]:
-        return ["ROB_1"]
+    def get_mechunits(self) -> Sequence[str]:
+        return self._mechunits
 
     # Geometry helpers
     def get_jointtarget(self, mechunit: str = "ROB_1") -> JointTarget:
-        return JointTarget(robax=np.zeros(6), extax=np.zeros(6))
+        return JointTarget(robax=self._zeros6, extax=self._zeros6)
 
     def get_robtarget(
         self, mechunit: str = "ROB_1", tool: str = "tool0", wobj: str = "wobj0", coordinate: str = "Base"
     ) -> RobTarget:
         return RobTarget(
-            trans=np.zeros(3),
-            rot=np.array([1.0, 0.0, 0.0, 0.0]),
-            robconf=np.array([0, 0, 0, 0]),
-            extax=np.zeros(6),
+            trans=self._zeros3,
+            rot=self._ident_quat,
+            robconf=self._robconf,
+            extax=self._zeros6,
         )
@@ -8,6 +8,7 @@ from textual.widgets import Header, Footer, Button, Static, ListView, ListItem
 from textual.containers import Container
 import importlib
 import inspect
+from typing import Callable, Dict, Tuple
 
 from abb_robot_client.rws2 import RWS2
 
@@ -15,10 +16,16 @@ from abb_robot_client.rws2 import RWS2
 test_module = importlib.import_module("test_RWS2_POST")
 
 
+# Test name -> (function, parameter count), introspected once at import
+_TEST_FUNCS: Dict[str, Tuple[Callable, int]] = {
+    name: (func, len(inspect.signature(func).parameters))
+    for name, func in inspect.getmembers(test_module, inspect.isfunction)
+    if name.startswith("test_")
+}
+
+
 def get_test_functions():
-    return [
-        (name, func) for name, func in inspect.getmembers(test_module, inspect.isfunction) if name.startswith("test_")
-    ]
+    return [(name, func) for name, (func, _) in _TEST_FUNCS.items()]
 
 
 class TestResult(Static):
@@ -36,18 +43,17 @@ class TestRWS2POST(App):
     def compose(self) -> ComposeResult:
         yield Header()
         yield Container(
-            ListView(*[ListItem(Button(name, id=name)) for name, _ in get_test_functions()], id="test-list"),
+            ListView(*[ListItem(Button(name, id=name)) for name in _TEST_FUNCS], id="test-list"),
             TestResult("Select a test to run.", id="result"),
         )
         yield Footer()
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         test_name = event.button.id
-        test_func = dict(get_test_functions())[test_name]
+        test_func, nparams = _TEST_FUNCS[test_name]
         result_widget = self.query_one("#result", TestResult)
         try:
-            sig = inspect.signature(test_func)
-            if len(sig.parameters) == 1:
+            if nparams == 1:
                 await asyncio.to_thread(test_func, self.client)
             else:
                 await asyncio.to_thread(test_func)
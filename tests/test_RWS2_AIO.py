@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from abb_robot_client.rws import ABBException
+from abb_robot_client.rws2 import VariableValue
+from abb_robot_client.rws2_aio import RWS2_AIO
+
+# Offline tests: the client's transport is replaced with an in-process handler serving canned RWS2 responses
+_RAPID_VALUES = {"MOTION_PROGRAM_CMD_MOVEL": "3", "test_num": "0"}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    parts = request.url.path.strip("/").split("/")
+    if parts[:3] == ["rw", "rapid", "symbol"] and parts[5] in _RAPID_VALUES:
+        return httpx.Response(200, json={"state": [{"value": _RAPID_VALUES[parts[5]]}]})
+    if request.url.path == "/rw/iosystem/signals/IntBus/IoPanel/Auto":
+        return httpx.Response(200, json={"_embedded": {"resources": [{"lvalue": "1"}]}})
+    if request.url.path == "/rw/panel/ctrl-state":
+        return httpx.Response(200, json={"state": [{"ctrlstate": "motoron"}]})
+    return httpx.Response(404)
+
+
+def _make_client() -> RWS2_AIO:
+    client = RWS2_AIO(base_url="http://controller")
+    client._session = httpx.AsyncClient(base_url="http://controller", transport=httpx.MockTransport(_handler))
+    return client
+
+
+def _run(coro_fn):
+    async def _main():
+        client = _make_client()
+        try:
+            return await coro_fn(client)
+        finally:
+            await client.close()
+
+    return asyncio.run(_main())
+
+
+def test_batch_get_rapid_variables():
+    res = _run(lambda c: c.batch_get_rapid_variables(["MOTION_PROGRAM_CMD_MOVEL", "test_num"]))
+    assert res == [
+        VariableValue(name="MOTION_PROGRAM_CMD_MOVEL", value="3", task="T_ROB1"),
+        VariableValue(name="test_num", value="0", task="T_ROB1"),
+    ]
+
+
+def test_batch_get_rapid_variables_names_failed_variable():
+    with pytest.raises(ABBException, match="T_ROB1/missing"):
+        _run(lambda c: c.batch_get_rapid_variables(["test_num", "missing"]))
+
+
+def test_get_many_returns_none_for_failed_reads():
+    res = _run(lambda c: c.get_many([("rw/panel/ctrl-state", None), ("rw/does/not/exist", None)]))
+    assert res[0]["state"][0]["ctrlstate"] == "motoron"
+    assert res[1] is None
+
+
+def test_get_controller_state():
+    assert _run(lambda c: c.get_controller_state()) == "motoron"
+
+
+def test_get_many_establishes_session_before_concurrent_reads():
+    cookies = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        cookies.append(request.headers.get("cookie"))
+        await asyncio.sleep(0)  # let concurrent requests interleave
+        return httpx.Response(
+            200, json={"state": [{"ctrlstate": "motoron"}]}, headers={"set-cookie": "-http-session-=1; Path=/"}
+        )
+
+    async def _main():
+        client = RWS2_AIO(base_url="http://controller")
+        client._session = httpx.AsyncClient(base_url="http://controller", transport=httpx.MockTransport(handler))
+        try:
+            return await client.get_many([("rw/panel/ctrl-state", None)] * 4)
+        finally:
+            await client.close()
+
+    res = asyncio.run(_main())
+    assert len(res) == 4
+    assert cookies[0] is None
+    assert cookies[1:] == ["-http-session-=1"] * 3
+
+
+def test_get_digital_io_uses_rws2_signal_url():
+    assert _run(lambda c: c.get_digital_io("Auto", network="IntBus", unit="IoPanel")) == 1
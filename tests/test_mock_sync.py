@@ -53,13 +53,15 @@ COMMON_METHODS = [
     "get_robtarget",
 ]
 
+_REQUIRED = frozenset(COMMON_METHODS)
+
 
 def test_common_methods_present_on_all():
     for cls in (RWS, RWS2, RWSMock):
-        for name in COMMON_METHODS:
-            assert hasattr(cls, name), f"{cls.__name__} missing method: {name}"
-            attr = getattr(cls, name)
-            assert callable(attr), f"{cls.__name__}.{name} is not callable"
+        missing = _REQUIRED - set(dir(cls))
+        assert not missing, f"{cls.__name__} missing methods: {sorted(missing)}"
+        not_callable = [name for name in _REQUIRED if not callable(getattr(cls, name))]
+        assert not not_callable, f"{cls.__name__} non-callable attributes: {sorted(not_callable)}"
 
 
 def test_mock_conforms_to_protocol():
@@ -81,3 +83,103 @@ def test_mock_geometry_return_types():
     rt = mock.get_robtarget()
     assert isinstance(jt, JointTarget)
     assert isinstance(rt, RobTarget)
+
+
+def test_rws2_taskstate_normalizes_flag_strings():
+    task = rws2_mod.TaskState.model_validate(
+        {
+            "name": "T_ROB1",
+            "type": "normal",
+            "taskstate": "started",
+            "excstate": "stopped",
+            "active": " On ",
+            "motiontask": "unknown",
+        }
+    )
+    assert task.active is True
+    assert task.motiontask is False
+
+
+def test_mock_rapid_num_array_cache_invalidated_on_set():
+    mock = RWSMock()
+    mock.set_rapid_variable("arr", "1,2,3")
+    first = mock.get_rapid_variable_num_array("arr")
+    assert first.tolist() == [1.0, 2.0, 3.0]
+    assert mock.get_rapid_variable_num_array("arr") is first
+    mock.set_rapid_variable("arr", "4,5")
+    assert mock.get_rapid_variable_num_array("arr").tolist() == [4.0, 5.0]
+    mock.set_rapid_variable_num("arr", 6)
+    assert mock.get_rapid_variable_num_array("arr").tolist() == [6.0]
+
+
+def test_mock_read_event_log_bulk_columns():
+    import numpy as np
+
+    mock = RWSMock()
+    cols = mock.read_event_log_bulk()
+    n = len(mock.read_event_log())
+    assert all(len(col) == n for col in cols.values())
+    for name in ("seqnum", "msgtype", "code"):
+        assert cols[name].dtype == np.int64
+    for name in ("title", "desc", "tstamp"):
+        assert cols[name].dtype == object
+    assert cols["title"][0] == mock.read_event_log()[0].title
+
+
+def test_mock_read_file_view_and_str_cache():
+    mock = RWSMock()
+    view = mock.read_file_view("motion_program_exec.mod", directory="$HOME")
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert view.tobytes() == mock.read_file("motion_program_exec.mod", directory="$HOME")
+
+    mock.upload_file("test.mod", "MODULE a\nENDMODULE\n", directory="$HOME")
+    assert mock.read_file_str("test.mod", directory="$HOME") == "MODULE a\nENDMODULE\n"
+    mock.upload_file("test.mod", "MODULE b\nENDMODULE\n", directory="$HOME")
+    assert mock.read_file_str("test.mod", directory="$HOME") == "MODULE b\nENDMODULE\n"
+    mock.delete_file("test.mod", directory="$HOME")
+    assert mock.read_file_str("test.mod", directory="$HOME").startswith("Path does not exist")
+
+
+def test_mock_batch_io_getters():
+    mock = RWSMock()
+    mock.set_digital_io("motion_program_error", 1)
+    mock.set_analog_io("motion_program_preempt", 2.5)
+    assert mock.get_digital_ios(["Auto", "motion_program_error", "unknown"]) == {
+        "Auto": 1,
+        "motion_program_error": 1,
+        "unknown": 0,
+    }
+    assert mock.get_analog_ios(["motion_program_preempt", "unknown"]) == {"motion_program_preempt": 2.5, "unknown": 0.0}
+    assert mock.get_digital_ios(["Auto"]) == {"Auto": mock.get_digital_io("Auto")}
+
+
+def test_rws2_value_types_model_validate_coerces_and_ignores_extra_keys():
+    robax = rws2_mod.RobAx.model_validate(
+        {"_type": "ms-robax", "rax_1": "1.5", "rax_2": 2, "rax_3": "3", "rax_4": 4.0, "rax_5": "5", "rax_6": "6"}
+    )
+    assert robax == (1.5, 2.0, 3.0, 4.0, 5.0, 6.0)
+    assert all(isinstance(v, float) for v in robax)
+    value = rws2_mod.VariableValue.model_validate({"name": "n", "value": 3, "_title": "T_ROB1/n"})
+    assert value == rws2_mod.VariableValue(name="n", value="3", task=None)
+
+
+def test_rws2_encode_form_keeps_value_types_apart():
+    assert rws2_mod._encode_form({"lvalue": 1}) == b"lvalue=1"
+    assert rws2_mod._encode_form({"lvalue": True}) == b"lvalue=True"
+    assert rws2_mod._encode_form({"lvalue": 1.0}) == b"lvalue=1.0"
+
+
+def test_rws2_pers_cache_skips_reads_overlapping_a_write():
+    client = RWS2(base_url="http://127.0.0.1:9")
+    client._mastership_held = True
+
+    def _do_get(relative_url, params=None, timeout=None):
+        # A write lands while this read is in flight
+        client.set_rapid_variable("n", "new")
+        return {"state": [{"value": "old"}]}
+
+    client._do_get = _do_get
+    client._do_post = lambda relative_url, data=None: None
+    assert client.get_rapid_variable("n") == "old"
+    assert ("T_ROB1", "n") not in client._pers_cache